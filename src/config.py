@@ -25,6 +25,10 @@ DEFAULT_LOG_LEVEL = "info"
 # Logging Configuration
 LOG_LEVELS = {"info": "INFO", "warn": "WARNING", "error": "ERROR"}
 
+# Wallet Configuration
+WALLET_PASSWORD_ATTEMPTS = 3
+WALLET_PASSWORD_ENV = "WALLET_PASSWORD"  # noqa: S105
+
 # Exit Codes
 ERR_WALLET_PASSWORD = 1
 ERR_CLIENT_CONNECT = 2
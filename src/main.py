@@ -4,8 +4,8 @@ import argparse
 import asyncio
 import logging
 import logging.config
+from pathlib import Path
 
-import anyio
 from golem_base_sdk import (
     Annotation,
     GolemBaseClient,
@@ -67,11 +67,7 @@ INSTANCE_URLS = {
 
 async def run_example(instance: str) -> None:  # noqa: PLR0915
     """Run the example."""
-    async with await anyio.open_file(
-        "./private.key",
-        "rb",
-    ) as private_key_file:
-        key_bytes = await private_key_file.read(32)
+    key_bytes = Path("./private.key").read_bytes()[:32]
 
     client = await GolemBaseClient.create(
         rpc_url=INSTANCE_URLS[instance]["rpc"],
@@ -1,25 +1,49 @@
 """Shared utilities for the Golem Python client."""
 
 import asyncio
+import atexit
 import getpass
-import json
+import itertools
 import logging
+import operator
+import os
+import queue
+import re
 import sys
 from collections.abc import Coroutine
 from concurrent.futures import ThreadPoolExecutor
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
+from weakref import WeakValueDictionary
 
+import orjson
 from eth_account import Account
 from golem_base_sdk import EntityKey, EntityMetadata, GenericBytes, GolemBaseClient
 from web3 import Web3
 
-from config import ERR_CLIENT_CONNECT, ERR_WALLET_PASSWORD, LOG_LEVELS, NETWORK_URLS
+from config import (
+    ERR_CLIENT_CONNECT,
+    ERR_WALLET_PASSWORD,
+    LOG_LEVELS,
+    NETWORK_URLS,
+    WALLET_PASSWORD_ATTEMPTS,
+    WALLET_PASSWORD_ENV,
+)
 from exceptions import WalletDecryptionError
 
 logger = logging.getLogger(__name__)
 
+# Interned entity keys, keyed by hex string or raw bytes
+_EK_CACHE: WeakValueDictionary[str | bytes, EntityKey] = WeakValueDictionary()
+
+# (key, value) pair of an annotation
+_ANNOTATION_KV = operator.attrgetter("key", "value")
+
+# Wallet file names: wallet_<username>.json
+_WALLET_RE = re.compile(r"wallet_(.*)\.json")
+
 
 def run_sync(routine: Coroutine[Any, Any, Any]) -> Any:  # noqa: ANN401
     """Run async routine in a synchronous context."""
@@ -64,25 +88,40 @@ def get_wallet_private_key(wallet_file: str) -> bytes:
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
-    with file.open("r") as f:
-        wallet_json = json.loads(f.read())
+    wallet_json = orjson.loads(file.read_bytes())
 
-    # Get password for wallet decryption
-    password = getpass.getpass(f"Enter password for wallet {wallet_file}: ")
+    # Decrypt the wallet to get the private key, wrong passwords may be retried
+    # when prompting on a terminal
+    interactive = WALLET_PASSWORD_ENV not in os.environ and sys.stdin.isatty()
+    for _ in range(WALLET_PASSWORD_ATTEMPTS if interactive else 1):
+        password = _read_wallet_password(wallet_file)
+        try:
+            return Account.decrypt(wallet_json, password)
+        except ValueError:
+            # ValueError is raised for MAC mismatch (wrong password)
+            logger.warning("Incorrect password for wallet %s", wallet_file)
+        except Exception as e:  # noqa: BLE001
+            # Handle other potential decryption errors
+            error_msg = f"Failed to decrypt wallet - {type(e).__name__}"
+            logger.error(error_msg)  # noqa: TRY400
+            raise WalletDecryptionError(error_msg) from None
+
+    error_msg = "Failed to decrypt wallet - incorrect password"
+    logger.error(error_msg)
+    raise WalletDecryptionError(error_msg)
 
-    # Decrypt the wallet to get the private key
-    try:
-        return Account.decrypt(wallet_json, password)
-    except ValueError:
-        # ValueError is raised for MAC mismatch (wrong password)
-        error_msg = "Failed to decrypt wallet - incorrect password"
-        logger.error(error_msg)  # noqa: TRY400
-        raise WalletDecryptionError(error_msg) from None
-    except Exception as e:  # noqa: BLE001
-        # Handle other potential decryption errors
-        error_msg = f"Failed to decrypt wallet - {type(e).__name__}"
-        logger.error(error_msg)  # noqa: TRY400
-        raise WalletDecryptionError(error_msg) from None
+
+def _read_wallet_password(wallet_file: str) -> str:
+    """Read the wallet password from the environment, piped stdin or terminal."""
+    password = os.environ.get(WALLET_PASSWORD_ENV)
+    if password is not None:
+        return password
+
+    # Skip the terminal handling of getpass when the password is piped in
+    if not sys.stdin.isatty():
+        return sys.stdin.readline().rstrip("\n")
+
+    return getpass.getpass(f"Enter password for wallet {wallet_file}: ")
 
 
 async def create_golem_client(network: str, wallet_file: str) -> GolemBaseClient:
@@ -130,42 +169,50 @@ def get_annotations(metadata: EntityMetadata) -> dict[str, str | int]:
     if not metadata:
         return {}
 
-    annotations = {}
-
-    if metadata.string_annotations:
-        annotations |= {a.key: a.value for a in metadata.string_annotations}
-
-    if metadata.numeric_annotations:
-        annotations |= {a.key: a.value for a in metadata.numeric_annotations}
-
-    return annotations
+    return dict(
+        map(
+            _ANNOTATION_KV,
+            itertools.chain(
+                metadata.string_annotations or (),
+                metadata.numeric_annotations or (),
+            ),
+        )
+    )
 
 
 def setup_logging(log_level: str) -> None:
     """Configure logging for the specified log level.
 
+    Messages and tracebacks are still merged on the calling thread when records
+    are enqueued, only the final formatting and writing to stdout happen on a
+    background listener thread.
+
     Args:
         log_level: Log level key (info, warn, error)
 
     """
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(logging.DEBUG)
+    console.setFormatter(
+        logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     dictConfig(
         {
             "version": 1,
-            "formatters": {
-                "default": {
-                    "format": "[%(asctime)s] %(levelname)s in %(module)s: %(message)s",
-                }
-            },
             "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "formatter": "default",
-                    "level": "DEBUG",
-                    "stream": "ext://sys.stdout",
+                "queue": {
+                    "()": QueueHandler,
+                    "queue": log_queue,
                 }
             },
             "loggers": {
-                "": {"level": LOG_LEVELS[log_level], "handlers": ["console"]},
+                "": {"level": LOG_LEVELS[log_level], "handlers": ["queue"]},
             },
             "disable_existing_loggers": False,
         }
@@ -176,19 +223,23 @@ def get_username(wallet_file: str) -> str | None:
     """Get the username from the wallet file name: wallet_<username>.json."""
     # Strip leading directories
     filename = Path(wallet_file).name
-    if filename.startswith("wallet_") and filename.endswith(".json"):
-        return filename[len("wallet_") : -len(".json")]
-
-    return None
+    return m.group(1) if (m := _WALLET_RE.fullmatch(filename)) else None
 
 
 def get_entity_key(entity_key: object) -> EntityKey:
-    """Get the entity key as an EntityKey object."""
-    if isinstance(entity_key, str):
-        return EntityKey(GenericBytes.from_hex_string(entity_key))
+    """Get the entity key as an EntityKey object.
 
-    if isinstance(entity_key, GenericBytes):
-        return EntityKey(entity_key)
+    Keys are interned, identical inputs return the same EntityKey instance.
+    """
+    if type(entity_key) is str:
+        cached = _EK_CACHE.get(entity_key)
+        if cached is None:
+            cached = EntityKey(GenericBytes.from_hex_string(entity_key))
+            _EK_CACHE[entity_key] = cached
+        return cached
+
+    if type(entity_key) is GenericBytes:
+        return _EK_CACHE.setdefault(entity_key.generic_bytes, EntityKey(entity_key))
 
     logger.warning(
         "Invalid entity key type %s. Returning empty EntityKey",
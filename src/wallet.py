@@ -1,15 +1,22 @@
 """Creates a new Ethereum wallet (JSON format)."""
 
 import getpass
-import json
+import os
 import sys
 from pathlib import Path
 
+import orjson
 from eth_account import Account
 
 WALLET_PATH = Path("wallet.json")
 KEY_PATH = Path("private.key")
 
+# Set to exactly "1" to create test-only wallets with a cheap scrypt work
+# factor (n=4096 instead of 262144) that unlock much faster. Never use for
+# real funds.
+WEAK_KDF_ENV = "TEST_WALLET_WEAK_KDF"
+WEAK_KDF_ITERATIONS = 4096
+
 if WALLET_PATH.exists():
     print(f'File "{WALLET_PATH}" already exists. Aborting.')
     sys.exit(0)
@@ -25,13 +32,17 @@ else:
     account = Account.create()
 
 password = getpass.getpass("Enter wallet password: ")
-encrypted = account.encrypt(password)
+if os.getenv(WEAK_KDF_ENV) == "1":
+    print("Using weak key derivation for test wallet.")
+    encrypted = account.encrypt(password, iterations=WEAK_KDF_ITERATIONS)
+else:
+    encrypted = account.encrypt(password)
 
-with WALLET_PATH.open("w") as f:
-    json.dump(encrypted, f)
+with WALLET_PATH.open("wb") as f:
+    f.write(orjson.dumps(encrypted))
 
 print(f"Account address: {account.address}")
 print(f"Wallet file: {WALLET_PATH}")
 
-# fetch private key from the wallet file: wallet_json = json.load(f)
+# fetch private key from the wallet file: wallet_json = orjson.loads(f.read())
 # to obtain decrypted key: account.decrypt(wallet_json, password)
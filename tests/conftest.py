@@ -1,32 +1,66 @@
 """Global test configuration and fixtures."""
 
 import asyncio
+import functools
 import logging
 import os
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 
 import pytest
+import requests
 import websockets
+from aiohttp import ClientSession, TCPConnector
+from docker.models.containers import Container
 from dotenv import load_dotenv
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from golem_base_sdk import GolemBaseClient
+from golem_base_sdk import (
+    EntityKey,
+    GolemBaseClient,
+    GolemBaseDelete,
+    GolemBaseHttpClient,
+)
+from requests.adapters import HTTPAdapter
+from testcontainers.core.config import testcontainers_config
 from testcontainers.core.container import DockerContainer
-from testcontainers.core.wait_strategies import HttpWaitStrategy
-from testcontainers.core.waiting_utils import wait_container_is_ready
+from web3 import AsyncHTTPProvider
+from web3.exceptions import Web3RPCError
+
+from .utils import WEI_PER_ETH
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
 DOT_ENV_FILE = ".env"
 
+# Set NODE_IMAGE to a digest reference (image@sha256:...) to pin the node version
+NODE_IMAGE_ENV = "NODE_IMAGE"
 NODE_IMAGE = "golemnetwork/golembase-op-geth:latest"
 NODE_PORT_HTTP = 8545
 NODE_PORT_WS = 8546
+NODE_REUSE_LABEL = "golemdb-test"
+
+# Node readiness polling, delays double after each failed probe
+NODE_STARTUP_TIMEOUT = 60
+NODE_POLL_INITIAL_DELAY = 0.05
+NODE_POLL_MAX_DELAY = 1.0
+
+# Keep-alive connection pool shared by all RPC clients, idle connections and
+# resolved node hosts are kept for the given number of seconds
+RPC_POOL_SIZE = 20
+RPC_KEEPALIVE_TIMEOUT = 60
+RPC_DNS_CACHE_TTL = 600
 
 # Environment variable names for external wallet configuration
 WALLET_FILE_ENV_PREFIX = "WALLET_FILE"
 WALLET_PASSWORD_ENV_PREFIX = "WALLET_PASSWORD"  # noqa: S105
+WALLET_PRIVATE_KEY_ENV_PREFIX = "WALLET_PRIVATE_KEY"
 
 # Environment variable names for external node configuration
 RPC_URL_ENV = "RPC_URL"
@@ -41,6 +75,39 @@ else:
     logger.info("Using system environment variables only (no .env file found)")
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add custom command line options."""
+    parser.addoption(
+        "--reuse-node",
+        action="store_true",
+        help=(
+            "Keep the GolemDB node container running after the tests and reuse it "
+            "in later runs. Requires TESTCONTAINERS_RYUK_DISABLED=true."
+        ),
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Reject --reuse-node while Ryuk would remove the kept node."""
+    if config.getoption("--reuse-node") and not testcontainers_config.ryuk_disabled:
+        msg = "--reuse-node requires TESTCONTAINERS_RYUK_DISABLED=true"
+        raise pytest.UsageError(msg)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop if it is installed.
+
+    pytest-asyncio 1.4 deprecates overriding this fixture, which is why the
+    dependency is capped below 1.4. Move to the pytest_asyncio_loop_factories
+    hook when raising the cap.
+    """
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture(scope="session")
 def use_testcontainers() -> bool:
     """Return true if GolemDB node is served by test testcontainer."""
@@ -53,7 +120,20 @@ def use_testcontainers() -> bool:
 
 
 @pytest.fixture(scope="session")
-def golemdb_node() -> Generator[tuple[DockerContainer | None, str, str], None, None]:
+def http_session() -> Generator[requests.Session, None, None]:
+    """Fixture to provide a keep-alive HTTP session for plain node requests."""
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        yield session
+
+
+@pytest.fixture(scope="session")
+def golemdb_node(
+    request: pytest.FixtureRequest,
+    http_session: requests.Session,
+) -> Generator[tuple[DockerContainer | None, str, str], None, None]:
     """Fixture to provide GolemDB node connection details."""
     external_config = _get_external_node_config()
 
@@ -62,47 +142,137 @@ def golemdb_node() -> Generator[tuple[DockerContainer | None, str, str], None, N
         yield None, rpc_http, rpc_ws
         logger.info("External GolemDB node session completed")
     else:
-        yield from _create_testcontainer_node()
+        reuse = request.config.getoption("--reuse-node")
+        yield from _create_testcontainer_node(http_session, reuse=reuse)
+
+
+@pytest.fixture(scope="session")
+def funded_accounts(
+    golemdb_node: tuple[DockerContainer | None, str, str],
+) -> tuple[LocalAccount, LocalAccount]:
+    """Fixture to get both client accounts from env vars or create using GolemDB node.
+
+    Accounts that need to be created are imported and funded in a single exec.
+    """
+    accounts = {account_num: _get_account(account_num) for account_num in (1, 2)}
+    missing = [num for num, account in accounts.items() if account is None]
+    if missing:
+        created = _create_funded_accounts(golemdb_node[0], missing)
+        accounts |= dict(zip(missing, created, strict=True))
+
+    return accounts[1], accounts[2]  # type: ignore[return-value]
 
 
 @pytest.fixture(scope="session")
-def client_account(
-    golemdb_node: tuple[DockerContainer | None, str, int, int],
-) -> LocalAccount:
+def client_account(funded_accounts: tuple[LocalAccount, LocalAccount]) -> LocalAccount:
     """Fixture to get client_account from env vars or create using GolemDB node."""
-    return _get_or_create_account(1, golemdb_node[0])
+    return funded_accounts[0]
 
 
 @pytest.fixture(scope="session")
-def client_account2(
-    golemdb_node: tuple[DockerContainer | None, str, int, int],
-) -> LocalAccount:
+def client_account2(funded_accounts: tuple[LocalAccount, LocalAccount]) -> LocalAccount:
     """Fixture to get client_account2 from env vars or create using GolemDB node."""
-    return _get_or_create_account(2, golemdb_node[0])
+    return funded_accounts[1]
+
+
+@pytest.fixture(scope="session")
+async def rpc_session() -> AsyncGenerator[ClientSession, None]:
+    """Fixture to provide a keep-alive HTTP session shared by the RPC clients."""
+    connector = TCPConnector(
+        limit=RPC_POOL_SIZE,
+        keepalive_timeout=RPC_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=RPC_DNS_CACHE_TTL,
+    )
+    async with ClientSession(raise_for_status=True, connector=connector) as session:
+        yield session
 
 
 @pytest.fixture(scope="session")
-async def client(
+async def clients(
     golemdb_node: tuple[DockerContainer | None, str, str],
+    rpc_session: ClientSession,
     client_account: LocalAccount,
-) -> GolemBaseClient:
-    """Fixture to provide a GolemBaseClient instance for tests."""
+    client_account2: LocalAccount,
+) -> AsyncGenerator[tuple[GolemBaseClient, GolemBaseClient], None]:
+    """Fixture to provide both GolemBaseClient instances, connected concurrently.
+
+    The clients are shared by all tests and disconnected at session end, which
+    also cancels any subscriptions left open by tests.
+    """
     _, rpc_url, ws_url = golemdb_node
-    return await create_client(rpc_url, ws_url, account=client_account)
+    client1, client2 = await asyncio.gather(
+        create_client(rpc_url, ws_url, account=client_account, session=rpc_session),
+        create_client(rpc_url, ws_url, account=client_account2, session=rpc_session),
+    )
+    yield client1, client2
+
+    await asyncio.gather(client1.disconnect(), client2.disconnect())
 
 
 @pytest.fixture(scope="session")
-async def client2(
-    golemdb_node: tuple[DockerContainer | None, str, str],
-    client_account2: LocalAccount,
-) -> GolemBaseClient:
+def client(clients: tuple[GolemBaseClient, GolemBaseClient]) -> GolemBaseClient:
     """Fixture to provide a GolemBaseClient instance for tests."""
-    _, rpc_url, ws_url = golemdb_node
-    return await create_client(rpc_url, ws_url, account=client_account2)
+    return clients[0]
+
+
+@pytest.fixture(scope="session")
+def client2(clients: tuple[GolemBaseClient, GolemBaseClient]) -> GolemBaseClient:
+    """Fixture to provide a GolemBaseClient instance for tests."""
+    return clients[1]
+
+
+@pytest.fixture(scope="session")
+async def cleanup_entities(
+    client: GolemBaseClient,
+) -> AsyncGenerator[list[EntityKey], None]:
+    """Fixture to collect entity keys of client that are deleted at session end.
+
+    All collected entities that still exist are removed in a single delete
+    transaction.
+    """
+    entity_keys: list[EntityKey] = []
+    yield entity_keys
+
+    # Skip entities that are already gone, e.g. expired by housekeeping, as a
+    # single missing entity fails the whole delete transaction
+    results = await asyncio.gather(
+        *(client.get_storage_value(entity_key) for entity_key in entity_keys),
+        return_exceptions=True,
+    )
+    entity_keys = [
+        entity_key
+        for entity_key, result in zip(entity_keys, results, strict=True)
+        if not isinstance(result, BaseException)
+    ]
+    if not entity_keys:
+        return
+
+    try:
+        await client.delete_entities([GolemBaseDelete(key) for key in entity_keys])
+        logger.info("Deleted %d test entities", len(entity_keys))
+    except Web3RPCError as e:
+        logger.warning("Failed to delete %d test entities: %s", len(entity_keys), e)
+
+
+@pytest.fixture(scope="session")
+def http_client(client: GolemBaseClient) -> GolemBaseHttpClient:
+    """Fixture to provide the web3 HTTP client of the client fixture."""
+    return client.http_client()
+
+
+@pytest.fixture(scope="session")
+async def account_balance(
+    http_client: GolemBaseHttpClient, client_account: LocalAccount
+) -> int:
+    """Fixture to provide the ETH balance (wei) of client_account."""
+    return await http_client.eth.get_balance(client_account.address)
 
 
 async def create_client(
-    rpc_url: str, ws_url: str, account: LocalAccount
+    rpc_url: str,
+    ws_url: str,
+    account: LocalAccount,
+    session: ClientSession | None = None,
 ) -> GolemBaseClient:
     """Create a GolemBaseClient instance."""
     logger.info(f"Connecting (http) {account.address} at {rpc_url}")  # noqa: G004
@@ -114,13 +284,19 @@ async def create_client(
         private_key=account.key,
     )
 
+    # Reuse the shared session instead of one non keep-alive session per client
+    provider = client.http_client().provider
+    if session is not None and isinstance(provider, AsyncHTTPProvider):
+        await provider.cache_async_session(session)
+
     # Wait for client to connect
     if not await client.is_connected():
         pytest.exit("Could not connect client.")
 
     # fetch eth balance of client account and abort if zero
     balance = await client.http_client().eth.get_balance(account.address)
-    print(f"ETH balance for {account.address}: {balance / 10**18}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("ETH balance for %s: %s", account.address, balance / WEI_PER_ETH)
 
     # abort tests if balance is zero
     if balance == 0:
@@ -142,22 +318,24 @@ def _get_external_node_config() -> tuple[str, str] | None:
     return rpc_url, ws_url
 
 
-def _create_testcontainer_node() -> Generator[
-    tuple[DockerContainer, str, str], None, None
-]:
+class GolemDBNodeContainer(DockerContainer):
+    """Testcontainer for the GolemDB node that can attach to a running node."""
+
+    def attach(self, container: Container) -> "GolemDBNodeContainer":
+        """Use an already running container instead of starting a new one."""
+        self._container = container
+        return self
+
+
+def _create_testcontainer_node(
+    http_session: requests.Session, *, reuse: bool = False
+) -> Generator[tuple[DockerContainer, str, str], None, None]:
     """Create and manage testcontainer GolemDB node."""
     logger.info("Starting up GolemDB node (testcontainer) ...")
 
-    # Create HTTP wait strategy for the node to be ready
-    http_wait = (
-        HttpWaitStrategy(port=NODE_PORT_HTTP)
-        .for_status_code(200)
-        .with_startup_timeout(60)
-        .with_poll_interval(1)
-    )
-
-    with (
-        DockerContainer(NODE_IMAGE)
+    image = os.getenv(NODE_IMAGE_ENV, NODE_IMAGE)
+    node = (
+        GolemDBNodeContainer(image)
         .with_exposed_ports(NODE_PORT_HTTP, NODE_PORT_WS)
         .with_command(
             "--dev "
@@ -174,59 +352,107 @@ def _create_testcontainer_node() -> Generator[
             f"--ws.port {NODE_PORT_WS} "
             "--datadir '/geth_data'"
         )
-        .waiting_for(http_wait) as container
-    ):
-        host = container.get_container_host_ip()
-        node_rpc_http = f"http://{host}:{container.get_exposed_port(NODE_PORT_HTTP)}"
-        node_rpc_ws = f"ws://{host}:{container.get_exposed_port(NODE_PORT_WS)}"
-
-        logger.info("GolemDB node HTTP endpoint is ready.")
-
-        # Additional wait for WebSocket endpoint using wait_container_is_ready
-        @wait_container_is_ready(ConnectionRefusedError, TimeoutError)
-        def check_websocket_ready() -> bool:
-            async def test_ws_connection() -> bool:
-                conn = await websockets.connect(node_rpc_ws, open_timeout=2)
-                await conn.close()
-                return True
+    )
 
-            return asyncio.get_event_loop().run_until_complete(test_ws_connection())
+    if reuse:
+        # Attach to a node left running by an earlier run, no teardown
+        node.with_kwargs(labels={NODE_REUSE_LABEL: "true"})
+        running = node.get_docker_client().client.containers.list(
+            filters={"label": f"{NODE_REUSE_LABEL}=true"}
+        )
+        if running:
+            logger.info("Reusing GolemDB node (testcontainer) %s", running[0].short_id)
+            node.attach(running[0])
+        else:
+            node.start()
 
-        # Wait for WebSocket to be ready
-        check_websocket_ready()
-        logger.info("GolemDB node WS endpoint is ready.")
+        yield _get_node_endpoints(node, http_session)
+        logger.info("GolemDB node (testcontainer) kept running for reuse")
+        return
 
-        logger.info("GolemDB node (testcontainer) running at %s", node_rpc_http)
-        yield container, node_rpc_http, node_rpc_ws
+    with node as container:
+        yield _get_node_endpoints(container, http_session)
 
         # Teardown after tests complete
         logger.info("GolemDB node (testcontainer) removed")
 
 
-def _get_or_create_account(
-    account_num: int, golemdb: DockerContainer | None
-) -> LocalAccount:
-    """Get account from environment variables or create and fund a new one."""
-    wallet_file_key = f"{WALLET_FILE_ENV_PREFIX}_{account_num}"
-    wallet_password_key = f"{WALLET_PASSWORD_ENV_PREFIX}_{account_num}"
+def _get_node_endpoints(
+    container: DockerContainer, http_session: requests.Session
+) -> tuple[DockerContainer, str, str]:
+    """Get node HTTP and WS endpoints once both are ready."""
+    host = container.get_container_host_ip()
+    node_rpc_http = f"http://{host}:{container.get_exposed_port(NODE_PORT_HTTP)}"
+    node_rpc_ws = f"ws://{host}:{container.get_exposed_port(NODE_PORT_WS)}"
+
+    # Wait for HTTP and WebSocket endpoints to be ready
+    _wait_for_node(http_session, node_rpc_http, node_rpc_ws)
+
+    logger.info("GolemDB node (testcontainer) running at %s", node_rpc_http)
+    return container, node_rpc_http, node_rpc_ws
+
+
+def _wait_for_node(http_session: requests.Session, rpc_http: str, rpc_ws: str) -> None:
+    """Poll node endpoints until ready, backing off only while probes fail."""
+    deadline = time.monotonic() + NODE_STARTUP_TIMEOUT
+    delay = NODE_POLL_INITIAL_DELAY
+    http_ready = False
+
+    while time.monotonic() < deadline:
+        if not http_ready and _is_http_ready(http_session, rpc_http):
+            http_ready = True
+            logger.info("GolemDB node HTTP endpoint is ready.")
+
+        if http_ready and _is_ws_ready(rpc_ws):
+            logger.info("GolemDB node WS endpoint is ready.")
+            return
+
+        time.sleep(delay)
+        delay = min(delay * 2, NODE_POLL_MAX_DELAY)
+
+    msg = f"GolemDB node not ready within {NODE_STARTUP_TIMEOUT} seconds"
+    raise TimeoutError(msg)
+
+
+def _is_http_ready(http_session: requests.Session, rpc_http: str) -> bool:
+    """Return true if the node HTTP endpoint responds with 200 OK."""
+    try:
+        return http_session.get(rpc_http, timeout=1).status_code == 200
+    except requests.RequestException:
+        return False
 
-    wallet_file = os.getenv(wallet_file_key)
-    wallet_password = os.getenv(wallet_password_key)
+
+def _is_ws_ready(rpc_ws: str) -> bool:
+    """Return true if a WebSocket connection to the node can be opened."""
+
+    async def test_ws_connection() -> None:
+        conn = await websockets.connect(rpc_ws, open_timeout=2)
+        await conn.close()
+
+    try:
+        asyncio.get_event_loop().run_until_complete(test_ws_connection())
+    except (OSError, websockets.WebSocketException):
+        return False
+
+    return True
+
+
+def _get_account(account_num: int) -> LocalAccount | None:
+    """Get account from environment variables, None if not configured."""
+    # A plain private key (e.g. CI test keys) skips the wallet scrypt entirely
+    private_key = os.getenv(f"{WALLET_PRIVATE_KEY_ENV_PREFIX}_{account_num}")
+    if private_key:
+        logger.info("Loading account %s from private key", account_num)
+        return Account.from_key(private_key)
+
+    wallet_file = os.getenv(f"{WALLET_FILE_ENV_PREFIX}_{account_num}")
+    wallet_password = os.getenv(f"{WALLET_PASSWORD_ENV_PREFIX}_{account_num}")
 
     if wallet_file and wallet_password:
         logger.info("Loading account %s from wallet file: %s", account_num, wallet_file)
         return _load_account_from_file(wallet_file, wallet_password)
 
-    if golemdb is None:
-        msg = (
-            f"No wallet file specified for account {account_num} and no testcontainer "
-            "available. Please set environment variables "
-            f"{wallet_file_key} and {wallet_password_key}."
-        )
-        raise ValueError(msg)
-
-    logger.info("Creating and funding new account %s using testcontainer", account_num)
-    return _create_funded_account(golemdb)
+    return None
 
 
 def _load_account_from_file(wallet_file: str, password: str) -> LocalAccount:
@@ -236,11 +462,8 @@ def _load_account_from_file(wallet_file: str, password: str) -> LocalAccount:
         msg = f"Wallet file not found: {wallet_file}"
         raise FileNotFoundError(msg)
 
-    with wallet_path.open() as f:
-        encrypted_key = f.read()
-
     # Decrypt the private key using the password
-    private_key = Account.decrypt(encrypted_key, password)
+    private_key = _decrypt_once(str(wallet_path.resolve()), password)
 
     # Create LocalAccount from the private key
     account = Account.from_key(private_key)
@@ -249,29 +472,49 @@ def _load_account_from_file(wallet_file: str, password: str) -> LocalAccount:
     return account
 
 
-def _create_funded_account(golemdb: DockerContainer) -> LocalAccount:
-    """Fixture to create and fund a test account in the GolemDB node."""
-    # Create a new account (generates a new private key)
-    acct: LocalAccount = Account.create()
+@functools.lru_cache
+def _decrypt_once(wallet_path: str, password: str) -> bytes:
+    """Decrypt a wallet file once per test session."""
+    with Path(wallet_path).open() as f:
+        encrypted_key = f.read()
+
+    return Account.decrypt(encrypted_key, password)
+
 
-    # Get the private key (as hex)
-    acct_address = acct.address
-    acct_private_key = acct.key.hex()
+def _create_funded_accounts(
+    golemdb: DockerContainer | None, account_nums: list[int]
+) -> list[LocalAccount]:
+    """Create and fund new test accounts in the GolemDB node."""
+    if golemdb is None:
+        msg = (
+            f"No wallet file specified for accounts {account_nums} and no "
+            "testcontainer available. Please set environment variables "
+            f"{WALLET_FILE_ENV_PREFIX}_<n> and {WALLET_PASSWORD_ENV_PREFIX}_<n>."
+        )
+        raise ValueError(msg)
 
-    # Import account inside the container
-    exit_code, output = golemdb.exec(
-        ["golembase", "account", "import", "--key", acct_private_key]
+    logger.info(
+        "Creating and funding new accounts %s using testcontainer", account_nums
     )
-    assert exit_code == 0, f"Account import failed: {output.decode()}"
 
-    # Fund account inside the container
-    exit_code, output = golemdb.exec(["golembase", "account", "fund"])
-    assert exit_code == 0, f"Account funding failed: {output.decode()}"
-    logger.info(f"Imported and funded account: {acct_address}")  # noqa: G004
+    # Create new accounts (generates new private keys)
+    accounts: list[LocalAccount] = [Account.create() for _ in account_nums]
 
-    # Printing account balance
-    exit_code, output = golemdb.exec(["golembase", "account", "balance"])
-    assert exit_code == 0, f"Account balance check failed: {output.decode()}"
-    logger.info(f"Account balance: {output.decode().strip()}, exit_code: {exit_code}")  # noqa: G004
+    # Import, fund and check balance of all accounts in a single container exec.
+    # Funding applies to the most recently imported account.
+    command = " && ".join(
+        f"golembase account import --key {acct.key.hex()} "
+        "&& golembase account fund "
+        "&& golembase account balance"
+        for acct in accounts
+    )
+    exit_code, output = golemdb.exec(["sh", "-c", command])
+    assert exit_code == 0, f"Account import/funding failed: {output.decode()}"
+    logger.info("Imported and funded accounts: %s", [acct.address for acct in accounts])
+
+    # Printing command output, including the account balances
+    logger.info(
+        "Account balances: %s, exit_code: %s", output.decode().strip(), exit_code
+    )
 
-    return acct
+    return accounts
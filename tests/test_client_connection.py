@@ -5,20 +5,24 @@ import logging
 import pytest
 import requests
 from eth_account.signers.local import LocalAccount
-from golem_base_sdk import GolemBaseClient
+from golem_base_sdk import GolemBaseClient, GolemBaseHttpClient
 from testcontainers.core.container import DockerContainer
 
+from .utils import WEI_PER_ETH
+
 logger = logging.getLogger(__name__)
 
 
-def test_golemdb_node(golemdb_node: tuple[DockerContainer, str, str]) -> None:
+def test_golemdb_node(
+    golemdb_node: tuple[DockerContainer, str, str], http_session: requests.Session
+) -> None:
     """Check if the Golem DB node is available and responsive via JSON-RPC."""
     _, rpc_url, _ = golemdb_node
 
     # Use JSON-RPC call - works for both dev and production nodes
     rpc_payload = {"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1}
 
-    response = requests.post(
+    response = http_session.post(
         rpc_url,
         json=rpc_payload,
         headers={"Content-Type": "application/json"},
@@ -41,28 +45,28 @@ def test_golemdb_node(golemdb_node: tuple[DockerContainer, str, str]) -> None:
 
 @pytest.mark.asyncio
 async def test_funded_account(
-    client: GolemBaseClient, client_account: LocalAccount
+    account_balance: int, client_account: LocalAccount
 ) -> None:
     """Check if the Golem DB node (testcontainer) is available and responsive."""
     logger.info(f"Testing funded account: {client_account.address}")  # noqa: G004
-    http_client = client.http_client()
-    account_balance = await http_client.eth.get_balance(client_account.address)
     assert account_balance > 0, f"Balance should be > 0, balance: {account_balance}"
 
 
 @pytest.mark.asyncio
-async def test_client_instance(client: GolemBaseClient) -> None:
-    """Test that the client fixture provides a valid GolemBaseClient instance."""
+async def test_client(
+    client: GolemBaseClient,
+    http_client: GolemBaseHttpClient,
+    client_account: LocalAccount,
+    account_balance: int,
+) -> None:
+    """Test the client fixture instance, HTTP client, contract and account."""
+    # Client instance
     assert client is not None, "Client fixture should not be None"
     assert isinstance(client, GolemBaseClient), (
         "Client fixture should be an instance of GolemBaseClient"
     )
 
-
-@pytest.mark.asyncio
-async def test_client_http(client: GolemBaseClient) -> None:
-    """Test that the client fixture provides a valid GolemBaseClient instance."""
-    http_client = client.http_client()
+    # HTTP client
     assert http_client, "HTTP client should not be None"
 
     assert hasattr(http_client, "provider"), (
@@ -81,45 +85,33 @@ async def test_client_http(client: GolemBaseClient) -> None:
         "Endpoint URI should start with 'http'"
     )
 
-
-@pytest.mark.asyncio
-async def test_client_connection(client: GolemBaseClient) -> None:
-    """Test that the client can establish a connection to the Golem Base network."""
-    logger.debug("Testing client connection...")
-    is_connected = await client.is_connected()
-    logger.info("Client connection status: %s", is_connected)
-    assert isinstance(is_connected, bool), "Connection status should be a boolean"
-    assert is_connected, "Client should be connected to the Golem Base network"
-
-
-@pytest.mark.asyncio
-async def test_client_contract_address(client: GolemBaseClient) -> None:
-    """Test that the client has access to the GolemBase contract."""
+    # GolemBase contract
     contract_address = client.golem_base_contract.address
     logger.info("Contract address: %s", contract_address)
     assert contract_address is not None
     assert isinstance(contract_address, str)
 
-
-@pytest.mark.asyncio
-async def test_client_account(
-    client: GolemBaseClient, client_account: LocalAccount
-) -> None:
-    """Test that the client is connected to a valid address and has some funding."""
+    # Account address and funding
     account_address = client.get_account_address()
 
-    # Basic checks on the account address
     assert account_address is not None
     assert isinstance(account_address, str)
-    assert client.http_client().is_address(account_address), (
-        "Account address should be valid"
-    )
+    assert http_client.is_address(account_address), "Account address should be valid"
 
     assert account_address == client_account.address
 
-    # Check account balance
-    account_balance = await client.http_client().eth.get_balance(account_address)
     assert isinstance(account_balance, int), "Account balance should be an integer"
-    logger.info(f"Client account balance: ETH {account_balance / 10**18}")  # noqa: G004
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Client account balance: ETH %s", account_balance / WEI_PER_ETH)
 
     assert account_balance > 0, "Account should have a balance > 0"
+
+
+@pytest.mark.asyncio
+async def test_client_connection(client: GolemBaseClient) -> None:
+    """Test that the client can establish a connection to the Golem Base network."""
+    logger.debug("Testing client connection...")
+    is_connected = await client.is_connected()
+    logger.info("Client connection status: %s", is_connected)
+    assert isinstance(is_connected, bool), "Connection status should be a boolean"
+    assert is_connected, "Client should be connected to the Golem Base network"
@@ -1,19 +1,26 @@
 """Tests for GolemBase entity creation functionality."""
 
+import asyncio
 import logging
+from operator import attrgetter
 
 import pytest
 from golem_base_sdk import (
     Annotation,
     CreateEntityReturnType,
+    EntityKey,
     EntityMetadata,
     GenericBytes,
     GolemBaseClient,
     GolemBaseCreate,
-    GolemBaseDelete,
 )
 
-from .utils import create_single_entity, get_entity_count, to_create_entity
+from .utils import (
+    create_single_entity,
+    to_annotations_int,
+    to_annotations_str,
+    to_create_entity,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +30,13 @@ async def test_create_entity_receipt(client: GolemBaseClient) -> None:
     """Test creating an entity and verify there is a creation receipt."""
     logger.info("Testing entity creation receipt...")
 
-    # Get entity count
-    await get_entity_count(client, "before creation")
-
     # Create single entity
     create_receipt = await client.create_entities(
         [GolemBaseCreate(b"hello", 60, [Annotation("app", "test")], [])]
     )
 
-    # check entity count after creation might be useless as a number of
-    # entities may be deleted by houskeeping
+    # no entity count checks, the count may change at any time as entities
+    # are also deleted by housekeeping
 
     # Verify receipt exists and has expected structure
     assert create_receipt is not None, "Creation receipt should not be None"
@@ -104,43 +108,15 @@ async def test_create_entity_metadata(client: GolemBaseClient) -> None:
     metadata = await client.get_entity_metadata(entity_key)
     assert metadata is not None, "Metadata should not be None"
     assert isinstance(metadata, EntityMetadata), "Metadata should be a EntityMetadata"
-    assert hasattr(metadata, "expires_at_block"), (
-        "Metadata should have expires_at_block"
-    )
-
-    assert hasattr(metadata, "string_annotations"), (
-        "Metadata should have string_annotations"
-    )
-    test_str_annotations = metadata.string_annotations
-    # check that string annotations have correct type and values
-    assert isinstance(test_str_annotations, list), "String annotations should be a list"
-    assert all(isinstance(ann, Annotation) for ann in test_str_annotations), (
-        "All string annotations should be Annotation instances"
-    )
-    assert len(test_str_annotations) == len(string_annotations.keys()), (
-        "Number of string annotations should match the size of the original dictionary"
-    )
-    assert all(
-        ann.value == string_annotations[ann.key] for ann in test_str_annotations
-    ), "All string annotation values should should match the expected values"
 
-    # check that numeric annotations have correct type and values
-    assert hasattr(metadata, "numeric_annotations"), (
-        "Metadata should have numeric_annotations"
-    )
-    test_num_annotations = metadata.numeric_annotations
-    assert isinstance(test_num_annotations, list), (
-        "Numeric annotations should be a list"
-    )
-    assert len(test_num_annotations) == len(numeric_annotations.keys()), (
-        "Number of numeric annotations should match the size of the original dictionary"
-    )
-    assert all(isinstance(ann, Annotation) for ann in test_num_annotations), (
-        "All numeric annotations should be Annotation instances"
-    )
-    assert all(
-        ann.value == numeric_annotations[ann.key] for ann in test_num_annotations
-    ), "All numeric annotation values should should match the expected values"
+    # Compare annotations independent of their order
+    by_key = attrgetter("key")
+    assert sorted(metadata.string_annotations, key=by_key) == sorted(
+        to_annotations_str(string_annotations), key=by_key
+    ), "String annotations should match the expected annotations"
+    assert sorted(metadata.numeric_annotations, key=by_key) == sorted(
+        to_annotations_int(numeric_annotations), key=by_key
+    ), "Numeric annotations should match the expected annotations"
 
     logger.info("Entity metadata: %s", metadata)
 
@@ -148,17 +124,16 @@ async def test_create_entity_metadata(client: GolemBaseClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_create_multiple_entities(client: GolemBaseClient) -> None:
+async def test_create_multiple_entities(
+    client: GolemBaseClient, cleanup_entities: list[EntityKey]
+) -> None:
     """Test creating multiple entities in a single call."""
     logger.info("Testing multiple entity creation...")
 
     # Create multiple entities
+    payloads = [b"entity1", b"entity2", b"entity3"]
     create_receipts = await client.create_entities(
-        [
-            to_create_entity(b"entity1", 60, {"app": "batch_test"}),
-            to_create_entity(b"entity2", 60, {"app": "batch_test"}),
-            to_create_entity(b"entity3", 60, {"app": "batch_test"}),
-        ]
+        [to_create_entity(payload, 60, {"app": "batch_test"}) for payload in payloads]
     )
 
     # Verify all entities were created
@@ -173,27 +148,15 @@ async def test_create_multiple_entities(client: GolemBaseClient) -> None:
     logger.info("Created %d entities with keys: %s", len(entity_keys), entity_keys)
 
     # Verify each entity exists and has correct storage value
-    for i, entity_key in enumerate(entity_keys):
-        storage_value = await client.get_storage_value(entity_key)
-        expected_value = f"entity{i + 1}".encode()
-        assert storage_value == expected_value, (
+    storage_values = await asyncio.gather(
+        *(client.get_storage_value(entity_key) for entity_key in entity_keys)
+    )
+    for i, (storage_value, payload) in enumerate(
+        zip(storage_values, payloads, strict=True)
+    ):
+        assert storage_value == payload, (
             f"Storage value mismatch for entity {i + 1}"
         )
 
-    # Clean up - delete all entities
-    delete_objects = [GolemBaseDelete(key) for key in entity_keys]
-    await client.delete_entities(delete_objects)
-
-
-def _to_annotations(a: dict[str, str]) -> list[Annotation[str]]:
-    annotations = []
-    for key, value in a.items():
-        annotations.append(Annotation(key, value))
-    return annotations
-
-
-def _to_numeric_annotations(a: dict[str, int]) -> list[Annotation[int]]:
-    annotations = []
-    for key, value in a.items():
-        annotations.append(Annotation(key, value))
-    return annotations
+    # Clean up - delete all entities at session end
+    cleanup_entities.extend(entity_keys)
@@ -1,41 +1,59 @@
 """Tests for GolemBase entity creation functionality."""
 
 import logging
+import re
+from operator import attrgetter
 
 import pytest
-from golem_base_sdk import EntityKey, GolemBaseClient, GolemBaseDelete
+from golem_base_sdk import (
+    Annotation,
+    EntityKey,
+    EntityMetadata,
+    GolemBaseClient,
+    GolemBaseDelete,
+)
 from web3.exceptions import Web3RPCError
 
-from utils import get_address, get_annotations
+from utils import get_address
 
 from .utils import create_single_entity, to_update_entity
 
 logger = logging.getLogger(__name__)
 
+_NOT_OWNER_RE = re.compile("is not the owner")
+
+
+@pytest.fixture(scope="module")
+async def owner_entity(client: GolemBaseClient) -> EntityKey:
+    """Fixture to provide one entity owned by client for all ownership tests.
+
+    Owner updates keep the owner and non-owner changes fail, so the entity can
+    be shared independent of the test order.
+    """
+    return await _create_and_test_entity(client, b"owner_test", {"my_value": "a"})
+
 
 @pytest.mark.asyncio
-async def test_update_entity_by_owner(client: GolemBaseClient) -> None:
+async def test_update_entity_by_owner(
+    client: GolemBaseClient, owner_entity: EntityKey
+) -> None:
     """Test updating an entity by its owner."""
     logger.info("Testing entity creation receipt...")
 
-    entity_key = await _create_and_test_entity(client, b"owner_test", {"my_value": "a"})
-
     await _update_and_test_entity(
-        client, entity_key, b"owner_test_updated", {"my_value": "a_updated"}
+        client, owner_entity, b"owner_test_updated", {"my_value": "a_updated"}
     )
 
 
 @pytest.mark.asyncio
 async def test_update_entity_by_non_owner(
-    client: GolemBaseClient, client2: GolemBaseClient
+    client2: GolemBaseClient, owner_entity: EntityKey
 ) -> None:
     """Test updating an entity by non-owner fails with appropriate error."""
-    entity_key = await _create_and_test_entity(client, b"owner_test", {"my_value": "a"})
-
     # This should fail because client2 is not the owner
-    with pytest.raises(Web3RPCError, match="is not the owner") as exc_info:
+    with pytest.raises(Web3RPCError, match=_NOT_OWNER_RE) as exc_info:
         await _update_and_test_entity(
-            client2, entity_key, b"owner_test_updated", {"my_value": "a_updated"}
+            client2, owner_entity, b"owner_test_updated", {"my_value": "a_updated"}
         )
 
     logger.info(f"Expected exception: {exc_info.value}")
@@ -44,14 +62,12 @@ async def test_update_entity_by_non_owner(
 
 @pytest.mark.asyncio
 async def test_delete_entity_by_non_owner(
-    client: GolemBaseClient, client2: GolemBaseClient
+    client2: GolemBaseClient, owner_entity: EntityKey
 ) -> None:
     """Test deleting an entity by non-owner fails with appropriate error."""
-    entity_key = await _create_and_test_entity(client, b"owner_test", {"my_value": "a"})
-
     # This should fail because client2 is not the owner
-    with pytest.raises(Web3RPCError, match="is not the owner"):
-        await client2.delete_entities([GolemBaseDelete(entity_key)])
+    with pytest.raises(Web3RPCError, match=_NOT_OWNER_RE):
+        await client2.delete_entities([GolemBaseDelete(owner_entity)])
 
     logger.info("Entity delete by non-owner correctly failed")
 
@@ -70,17 +86,14 @@ async def _create_and_test_entity(
 
     # Verify entity owner
     metadata = await client.get_entity_metadata(entity_key)
-    assert get_address(metadata.owner) == get_address(owner), (
+    owner_address, metadata_owner = get_address(owner), get_address(metadata.owner)
+    assert metadata_owner == owner_address, (
         f"Metadata owner should match creator. "
-        f"Expected {get_address(owner)}, got {get_address(metadata.owner)}"
+        f"Expected {owner_address}, got {metadata_owner}"
     )
 
     # Verify annotations
-    annotations = get_annotations(metadata)
-    assert annotations == {"my_value": "a"}, (
-        f"Entity annotations should match. "
-        f"Expected {{'my_value': 'a'}}, got {annotations}"
-    )
+    _check_annotations(metadata, annotations)
 
     logger.info("Entity update by owner verified")
     return entity_key
@@ -97,16 +110,26 @@ async def _update_and_test_entity(
     # Verify entity owner
     owner = client.get_account_address()
     metadata = await client.get_entity_metadata(entity_key)
-    assert get_address(metadata.owner) == get_address(owner), (
+    owner_address, metadata_owner = get_address(owner), get_address(metadata.owner)
+    assert metadata_owner == owner_address, (
         f"Metadata owner should match creator/updator. "
-        f"Expected {get_address(owner)}, got {get_address(metadata.owner)}"
+        f"Expected {owner_address}, got {metadata_owner}"
     )
 
     # Verify annotations
-    annotations_to_verify = get_annotations(metadata)
-    assert annotations_to_verify == annotations, (
-        f"Entity annotations should match. "
-        f"Expected {annotations}, got {annotations_to_verify}"
-    )
+    _check_annotations(metadata, annotations)
 
     logger.info("Entity update by owner verified")
+
+
+def _check_annotations(metadata: EntityMetadata, annotations: dict) -> None:
+    by_key = attrgetter("key")
+    expected = sorted(
+        (Annotation(key, value) for key, value in annotations.items()), key=by_key
+    )
+    actual = sorted(
+        (*metadata.string_annotations, *metadata.numeric_annotations), key=by_key
+    )
+    assert actual == expected, (
+        f"Entity annotations should match. Expected {expected}, got {actual}"
+    )
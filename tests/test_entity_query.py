@@ -1,12 +1,16 @@
 """Tests for GolemBase entity query functionality."""
 
+import asyncio
 import logging
+from collections import Counter
 from collections.abc import Sequence
 
 import pytest
 from golem_base_sdk import (
+    Annotation,
     CreateEntityReturnType,
     GolemBaseClient,
+    GolemBaseCreate,
     QueryEntitiesResult,
 )
 
@@ -15,9 +19,35 @@ from .utils import create_single_entity, generate_uuid, to_create_entity
 AND = "&&"
 OR = "||"
 
+# Query template for the id annotation, clauses are combined with AND and OR
+ID_QUERY = 'id = "{id}"'
+
+# Entities created by _create_entries, only the batch ID annotation varies
+_ENTRIES: list[tuple[bytes, list[Annotation[str]], list[Annotation[int]]]] = [
+    (b"1", [Annotation("color", "red")], [Annotation("size", 10)]),
+    (b"2", [Annotation("color", "blue")], [Annotation("size", 12)]),
+    (b"3", [Annotation("color", "red")], [Annotation("size", 12)]),
+    (b"4", [Annotation("color", "green")], [Annotation("size", 10)]),
+]
+
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="module")
+async def query_batch(client: GolemBaseClient) -> tuple[str, list[str]]:
+    """Fixture to provide batch ID and keys of the entities shared by query tests.
+
+    The query tests only read the batch, so it is created once per module.
+    """
+    batch_id = generate_uuid()
+    create_receipts = await _create_entries(client, batch_id)
+    assert create_receipts is not None, "Create receipts should not be None"
+    assert len(create_receipts) == 4, "Should have created exactly 4 entities"
+    entity_keys = [receipt.entity_key.as_hex_string() for receipt in create_receipts]
+    logger.info("Created entities with keys: %s", entity_keys)
+    return batch_id, entity_keys
+
+
 @pytest.mark.asyncio
 async def test_entity_query_single(client: GolemBaseClient) -> None:
     """Create and query a single entity."""
@@ -28,10 +58,10 @@ async def test_entity_query_single(client: GolemBaseClient) -> None:
         client, payload, annotations={"id": uuid}
     )
     entity_key = create_entity[0].entity_key.as_hex_string()
-    logger.info(f"Created entity {create_entity}")  # noqa: G004
+    logger.info("Created entity %s", create_entity)
 
-    query = f'id = "{uuid}"'
-    logger.info(f"Using query: '{query}'")  # noqa: G004
+    query = ID_QUERY.format(id=uuid)
+    logger.info("Using query: '%s'", query)
     query_result = await client.query_entities(query)
     logger.info("Query result: %s", query_result)
 
@@ -45,36 +75,33 @@ async def test_entity_query_single(client: GolemBaseClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_entity_query_batch(client: GolemBaseClient) -> None:
-    """Create multiple entities and query them."""
-    # Create multiple entities
-    batch_id = generate_uuid()
-    create_receipts = await _create_entries(client, batch_id)
-    assert create_receipts is not None, "Create receipts should not be None"
-    assert len(create_receipts) == 4, "Should have created exactly 4 entities"
-    entity_keys = [receipt.entity_key.as_hex_string() for receipt in create_receipts]
-    logger.info(f"Created entities with keys: {entity_keys}")  # noqa: G004
+async def test_entity_query_batch(
+    client: GolemBaseClient, query_batch: tuple[str, list[str]]
+) -> None:
+    """Query multiple entities created in one batch."""
+    batch_id, entity_keys = query_batch
+
+    # Query by batch ID and by a non-existent batch ID concurrently
+    query = ID_QUERY.format(id=batch_id)
+    fake_query = ID_QUERY.format(id=generate_uuid())
+    logger.info("Using query: '%s'", query)
+    logger.info("Using fake query: '%s'", fake_query)
+    query_result, fake_query_result = await asyncio.gather(
+        client.query_entities(query), client.query_entities(fake_query)
+    )
 
-    # Query by batch ID
-    query = f'id = "{batch_id}"'
-    logger.info(f"Using query: '{query}'")  # noqa: G004
-    query_result = await client.query_entities(query)
     assert query_result is not None, "Query result should not be None"
     assert len(query_result) == 4, "Query should return exactly 4 entities"
     result_keys = [entity.entity_key for entity in query_result]
-    logger.info(f"Fetched results with keys: {result_keys}")  # noqa: G004
+    logger.info("Fetched results with keys: %s", result_keys)
 
     # Verify all created entities are in the query result
     for key in entity_keys:
         assert key in result_keys, (
-            f"Entity key {key.as_hex_string()} should be in the query result"
+            f"Entity key {key} should be in the query result"
         )
 
     # Check that querying with a non-existent batch ID returns no results
-    fake_batch_id = generate_uuid()
-    fake_query = f'id = "{fake_batch_id}"'
-    logger.info(f"Using fake query: '{fake_query}'")  # noqa: G004
-    fake_query_result = await client.query_entities(fake_query)
     assert fake_query_result is not None, "Fake query result should not be None"
     assert len(fake_query_result) == 0, "Fake query should return no entities"
 
@@ -97,7 +124,7 @@ async def test_entity_query_with_operator_and_fixme(client: GolemBaseClient) ->
         ]
     )
     entity_keys = [receipt.entity_key.as_hex_string() for receipt in create_receipts]
-    logger.info(f"Created entities with keys: {entity_keys}")  # noqa: G004
+    logger.info("Created entities with keys: %s", entity_keys)
 
     # Create second batch with different ID
     other_id = generate_uuid()
@@ -111,81 +138,70 @@ async def test_entity_query_with_operator_and_fixme(client: GolemBaseClient) ->
         ]
     )
     other_keys = [receipt.entity_key.as_hex_string() for receipt in other_receipts]
-    logger.info(f"Created other entities with keys: {other_keys}")  # noqa: G004
+    logger.info("Created other entities with keys: %s", other_keys)
 
     # Query with two 'and' operators (1 result expected)
-    query = f'id = "{batch_id}" {AND} color = "red" {AND} size = 10'
-    logger.info(f"Query: '{query}'")  # noqa: G004
+    query = f'{ID_QUERY.format(id=batch_id)} {AND} color = "red" {AND} size = 10'
+    logger.info("Query: '%s'", query)
     query_result = await client.query_entities(query)
-    logger.info(f"Result: '{query_result}'")  # noqa: G004
+    logger.info("Result: '%s'", query_result)
     _check_result("A", query_result, entity_keys, [data_1])  # type: ignore  # noqa: PGH003
 
 
 @pytest.mark.asyncio
-async def test_entity_query_with_operator_and(client: GolemBaseClient) -> None:
-    """Create multiple entities and query them with an AND operator."""
-    # Create multiple entities
-    batch_id = generate_uuid()
-    create_receipts = await _create_entries(client, batch_id)
-    entity_keys = [receipt.entity_key.as_hex_string() for receipt in create_receipts]
+async def test_entity_query_with_operator_and(
+    client: GolemBaseClient, query_batch: tuple[str, list[str]]
+) -> None:
+    """Query multiple entities with an AND operator."""
+    batch_id, entity_keys = query_batch
 
-    # Query by batch ID and color = green (1 results expected)
-    batch_id_clause = f'id = "{batch_id}"'
+    batch_id_clause = ID_QUERY.format(id=batch_id)
     green_clause = 'color = "green"'
-    query = f"{batch_id_clause} {AND} {green_clause}"
-    logger.info(f"Using query: '{query}'")  # noqa: G004
-
-    query_result = await client.query_entities(query)
-    logger.info(f"Query result: '{query_result}'")  # noqa: G004
-    _check_result("A", query_result, entity_keys, [b"4"])  # type: ignore  # noqa: PGH003
-
-    # Query by batch ID and color = red (2 results expected)
-    batch_id_clause = f'id = "{batch_id}"'
     red_clause = 'color = "red"'
-    query = f"{batch_id_clause} {AND} {red_clause}"
-    logger.info(f"Using single and query (2 results): '{query}'")  # noqa: G004
-
-    query_result = await client.query_entities(query)
-    logger.info(f"Query result: '{query_result}'")  # noqa: G004
-    _check_result("B", query_result, entity_keys, [b"1", b"3"])  # type: ignore  # noqa: PGH003
-
-    # Add size clause to the query (1 result expected)
     size_clause = "size = 10"
-    query = f"{batch_id_clause} {AND} {red_clause} {AND} {size_clause}"
-    logger.info(f"Using double and query (1 result): '{query}'")  # noqa: G004
-    query_result = await client.query_entities(query)
-    logger.info(f"Query result: '{query_result}'")  # noqa: G004
-    _check_result("C", query_result, entity_keys, [b"1"])  # type: ignore  # noqa: PGH003
-
-    # Add second color clause to the query (0 results expected)
     blue_clause = 'color = "blue"'
-    query = f"{batch_id_clause} {AND} {red_clause} {AND} {blue_clause}"
-    logger.info(f"Using double and query (0 results): '{query}'")  # noqa: G004
 
-    query_result = await client.query_entities(query)
-    logger.info(f"Query result: '{query_result}'")  # noqa: G004
-    _check_result("D", query_result, entity_keys, [])  # type: ignore  # noqa: PGH003
+    # Independent queries sent concurrently as (label, query, expected values)
+    checks = [
+        # Query by batch ID and color = green (1 results expected)
+        ("A", f"{batch_id_clause} {AND} {green_clause}", [b"4"]),
+        # Query by batch ID and color = red (2 results expected)
+        ("B", f"{batch_id_clause} {AND} {red_clause}", [b"1", b"3"]),
+        # Add size clause to the query (1 result expected)
+        ("C", f"{batch_id_clause} {AND} {red_clause} {AND} {size_clause}", [b"1"]),
+        # Add second color clause to the query (0 results expected)
+        ("D", f"{batch_id_clause} {AND} {red_clause} {AND} {blue_clause}", []),
+    ]
+    query_results = await asyncio.gather(
+        *(client.query_entities(query) for _, query, _ in checks)
+    )
+
+    for (label, query, expected_values), query_result in zip(
+        checks, query_results, strict=True
+    ):
+        logger.info("%s: Using query: '%s'", label, query)
+        logger.info("%s: Query result: '%s'", label, query_result)
+        _check_result(label, query_result, entity_keys, expected_values)
 
     logger.info("Multiple entity query with AND operator test passed successfully.")
 
 
 @pytest.mark.asyncio
-async def test_entity_query_with_operator_or(client: GolemBaseClient) -> None:
-    """Create multiple entities and query them with an OR operator."""
-    # Create multiple entities
-    batch_id = generate_uuid()
-    create_receipts = await _create_entries(client, batch_id)
-    entity_keys = [receipt.entity_key.as_hex_string() for receipt in create_receipts]
+async def test_entity_query_with_operator_or(
+    client: GolemBaseClient, query_batch: tuple[str, list[str]]
+) -> None:
+    """Query multiple entities with an OR operator."""
+    batch_id, entity_keys = query_batch
 
     # Query by batch ID and color = green (2 results expected)
-    batch_id_clause = f'id = "{batch_id}"'
+    batch_id_clause = ID_QUERY.format(id=batch_id)
     green_clause = 'color = "green"'
     blue_clause = 'color = "blue"'
     query = f"{batch_id_clause} {AND} ({green_clause} {OR} {blue_clause})"
-    logger.info(f"Using and/or query: '{query}'")  # noqa: G004
+    logger.info("Using and/or query: '%s'", query)
 
     query_result = await client.query_entities(query)
-    logger.info(f"Query result: '{query_result}'")  # noqa: G004
+    logger.info("Query result: '%s'", query_result)
     _check_result("A", query_result, entity_keys, [b"2", b"4"])  # type: ignore  # noqa: PGH003
 
 
@@ -202,21 +218,20 @@ def _check_result(
         f"{label}: Query should return exactly {len(expected_values)} entities, but got {query_result}"  # noqa: E501
     )
 
-    # Verify that all result keys are in the expected entity keys
-    result_keys = [entity.entity_key for entity in query_result]
-    for key in result_keys:
-        assert key in entity_keys, (
+    # Verify that all result keys are in the expected entity keys and that the
+    # result entity values match the expected values
+    expected_keys = frozenset(entity_keys)
+    remaining = Counter(expected_values)
+    for entity in query_result:
+        key, value = entity.entity_key, entity.storage_value
+        assert key in expected_keys, (
             f"{label}: Entity key {key} should be in the expected keys"
         )
-
-    # Verify that the result entity values match the expected values
-    values = [entity.storage_value for entity in query_result]
-    while len(values) > 0:
-        value = values.pop(0)
-        assert value in expected_values, (
+        assert remaining[value] > 0, (
             f"{label}: Query result has unexpected value: {value}, expected: {expected_values}"  # noqa: E501
         )
-        logger.info(f"{label}: Value {value} found in expected values")  # noqa: G004
+        remaining[value] -= 1
+        logger.info("%s: Value %s found in expected values", label, value)
 
 
 async def _create_entries(
@@ -224,9 +239,7 @@ async def _create_entries(
 ) -> Sequence[CreateEntityReturnType]:
     return await client.create_entities(
         [
-            to_create_entity(b"1", 60, {"id": batch_id, "color": "red", "size": 10}),
-            to_create_entity(b"2", 60, {"id": batch_id, "color": "blue", "size": 12}),
-            to_create_entity(b"3", 60, {"id": batch_id, "color": "red", "size": 12}),
-            to_create_entity(b"4", 60, {"id": batch_id, "color": "green", "size": 10}),
+            GolemBaseCreate(data, 60, [Annotation("id", batch_id), *str_ann], int_ann)
+            for data, str_ann, int_ann in _ENTRIES
         ]
     )
@@ -13,7 +13,8 @@ logger = logging.getLogger(__name__)
 
 
 def _create_callback(create_event: object) -> None:
-    logger.info("CREATE Event - Entity Key: {create_event.entity_key.as_hex_string()}")  # type: ignore  # noqa: PGH003
+    entity_key = create_event.entity_key.as_hex_string()  # type: ignore  # noqa: PGH003
+    logger.info("CREATE Event - Entity Key: %s", entity_key)
 
 
 def _skip_if_testcontainers(use_testcontainers: bool) -> None:
@@ -29,23 +30,35 @@ async def _test_create_event_callback(client: GolemBaseClient) -> None:
     """Test GolemDbClient wrapper with entity creation callbacks."""
     # Step 1: Wrap the client parameter
     db_client = GolemDbClient(client)
-    logger.info(f"Wrapped client: {type(db_client).__name__}")
+    logger.info("Wrapped client: %s", type(db_client).__name__)
 
-    # List of creation events
+    # List of creation events, event_received is set by the callback
     creation_events = []
+    event_received = asyncio.Event()
+    loop = asyncio.get_running_loop()
 
     # Helper to check events with timing
     async def _wait_for_event(expected_count: int, timeout_seconds: float = 2.0) -> None:
         """Wait for expected number of events with timeout."""
-        start_time = asyncio.get_event_loop().time()
+        deadline = loop.time() + timeout_seconds
         while len(creation_events) < expected_count:
-            if asyncio.get_event_loop().time() - start_time > timeout_seconds:
-                break
-            await asyncio.sleep(0.1)  # Check every 100ms
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            event_received.clear()
+            # asyncio.TimeoutError only became the builtin TimeoutError in 3.11
+            try:
+                await asyncio.wait_for(event_received.wait(), remaining)
+            except asyncio.TimeoutError:  # noqa: UP041
+                return
 
     # Check latest creation event
     async def _check_last_event(expected_count: int, expected_entity_key: str) -> None:
-        logger.info(f"Checking last event - Expected Count: {expected_count}, Expected Entity Key: {expected_entity_key}")
+        logger.info(
+            "Checking last event - Expected Count: %s, Expected Entity Key: %s",
+            expected_count,
+            expected_entity_key,
+        )
 
         await _wait_for_event(1)
         assert len(creation_events) == expected_count, f"Unexpected number of creation events: {len(creation_events)}, expected: {expected_count}"
@@ -56,7 +69,8 @@ async def _test_create_event_callback(client: GolemBaseClient) -> None:
     def event_creation_callback(create_event: object) -> None:
         entity_key = create_event.entity_key.as_hex_string() # type: ignore[attr-defined]
         creation_events.append(entity_key)
-        logger.info(f"Entity Created Callback - {entity_key}: {create_event}")
+        loop.call_soon_threadsafe(event_received.set)
+        logger.info("Entity Created Callback - %s: %s", entity_key, create_event)
 
     # Step 2: Create subscription for entity creation using context manager
     try:
@@ -82,5 +96,5 @@ async def _test_create_event_callback(client: GolemBaseClient) -> None:
     except TimeoutError:
         pytest.skip("WebSocket subscription timed out - infrastructure issue")
     except Exception as e:
-        logger.error(f"Test failed with error: {e}")
+        logger.error("Test failed with error: %s", e)
         raise
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Final
 import pytest
 from eth_typing import HexStr
 from golem_base_sdk import Address, Annotation, GenericBytes, GolemBaseClient, GolemBaseCreate
-from web3 import AsyncWeb3
+from web3 import AsyncWeb3, Web3
 
 if TYPE_CHECKING:
     from web3.types import LogsSubscriptionArg
@@ -14,6 +14,13 @@ if TYPE_CHECKING:
 STORAGE_ADDRESS: Final[Address] = Address(
     GenericBytes.from_hex_string("0x0000000000000000000000000000000060138453")
 )
+CREATE_EVENT_TOPIC: Final[HexStr] = HexStr(
+    Web3.keccak(text="GolemBaseStorageEntityCreated(uint256,uint256)").to_0x_hex()
+)
+CREATE_EVENT_FILTER: Final["LogsSubscriptionArg"] = {
+    "address": STORAGE_ADDRESS.as_address(),
+    "topics": [CREATE_EVENT_TOPIC],
+}
 
 
 logger = logging.getLogger(__name__)
@@ -30,16 +37,10 @@ async def test_subscribe_to_create_event(client: GolemBaseClient) -> None:
     assert await ws_client.is_connected(), "WebSocket client should be connected"
 
     async with ws_client as w3:
-        create_event_topic = w3.keccak(
-            text="GolemBaseStorageEntityCreated(uint256,uint256)"
+        logger.info("Creating create subscription: %s", CREATE_EVENT_FILTER)
+        subscription_id = await w3.eth.subscribe(
+            "logs", subscription_arg=CREATE_EVENT_FILTER
         )
-        filter_params: LogsSubscriptionArg = {
-            "address": STORAGE_ADDRESS.as_address(),
-            "topics": [HexStr(create_event_topic.to_0x_hex())],
-        }
-
-        logger.info("Creating create subscription: %s", filter_params)
-        subscription_id = await w3.eth.subscribe("logs", subscription_arg=filter_params)
         logger.info("Subscription %s successfully created.", subscription_id)
         assert subscription_id, "Subscription ID should not be None"
 
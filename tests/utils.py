@@ -1,6 +1,7 @@
 """Utility functions for GolemBase SDK tests."""
 
 import logging
+import operator
 import uuid
 from collections.abc import Sequence
 
@@ -15,6 +16,8 @@ from golem_base_sdk import (
 
 logger = logging.getLogger(__name__)
 
+WEI_PER_ETH = 10**18
+
 
 async def create_single_entity(
     client: GolemBaseClient,
@@ -29,8 +32,8 @@ async def create_single_entity(
 async def get_entity_count(client: GolemBaseClient, detail: str) -> int:
     """Get entity count and log it with a short wait for blockchain propagation."""
     count = await client.get_entity_count()
-    assert isinstance(count, int), "Entity count should be an integer"
-    assert count >= 0, "Entity count should be non-negative"
+    # operator.index raises TypeError for non-integer counts
+    assert operator.index(count) >= 0, "Entity count should be non-negative"
     logger.info(f"Entity count {detail}: {count}")  # noqa: G004
     return count
 
@@ -39,19 +42,7 @@ def to_create_entity(
     payload: bytes, btl: int = 60, annotations: dict[str, str | int] | None = None
 ) -> GolemBaseCreate:
     """Create a GolemBaseCreate instance with given payload and annotations."""
-    if annotations is None:
-        annotations = {}
-
-    # Split merged_annotations into str and int mappings
-    str_annotations = {k: v for k, v in annotations.items() if isinstance(v, str)}
-    int_annotations = {k: v for k, v in annotations.items() if isinstance(v, int)}
-
-    return GolemBaseCreate(
-        payload,
-        btl,
-        to_annotations_str(str_annotations),
-        to_annotations_int(int_annotations),
-    )
+    return GolemBaseCreate(payload, btl, *_split_annotations(annotations))
 
 
 def to_update_entity(
@@ -61,34 +52,30 @@ def to_update_entity(
     annotations: dict[str, str | int] | None = None,
 ) -> GolemBaseUpdate:
     """Create a GolemBaseUpdate instance with given payload and annotations."""
-    if annotations is None:
-        annotations = {}
+    return GolemBaseUpdate(entity_key, payload, btl, *_split_annotations(annotations))
+
 
-    # Split merged_annotations into str and int mappings
-    str_annotations = {k: v for k, v in annotations.items() if isinstance(v, str)}
-    int_annotations = {k: v for k, v in annotations.items() if isinstance(v, int)}
+def _split_annotations(
+    annotations: dict[str, str | int] | None,
+) -> tuple[list[Annotation[str]], list[Annotation[int]]]:
+    """Split merged annotations into str and int annotations in a single pass."""
+    str_annotations: list[Annotation[str]] = []
+    int_annotations: list[Annotation[int]] = []
+    for key, value in (annotations or {}).items():
+        if isinstance(value, str):
+            str_annotations.append(Annotation(key, value))
+        elif isinstance(value, int):
+            int_annotations.append(Annotation(key, value))
 
-    return GolemBaseUpdate(
-        entity_key,
-        payload,
-        btl,
-        to_annotations_str(str_annotations),
-        to_annotations_int(int_annotations),
-    )
+    return str_annotations, int_annotations
 
 
 def to_annotations_str(a: dict[str, str]) -> list[Annotation[str]]:  # noqa: D103
-    annotations = []
-    for key, value in a.items():
-        annotations.append(Annotation(key, value))
-    return annotations
+    return [Annotation(key, value) for key, value in a.items()]
 
 
 def to_annotations_int(a: dict[str, int]) -> list[Annotation[int]]:  # noqa: D103
-    annotations = []
-    for key, value in a.items():
-        annotations.append(Annotation(key, value))
-    return annotations
+    return [Annotation(key, value) for key, value in a.items()]
 
 
 def generate_uuid() -> str: